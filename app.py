@@ -1,32 +1,149 @@
 import os
+import time
+import atexit
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import fastjsonschema
 from flask import Flask, request, jsonify, render_template
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from pymongo import MongoClient
-from datetime import datetime, timedelta
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
 from bson.objectid import ObjectId
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 # --- Configuration ---
 MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017/')
 DB_NAME = 'attendance_tracking_db'
+MONGO_WRITE_POOL_SIZE = int(os.getenv('MONGO_WRITE_POOL_SIZE', 50)) # Connections for event inserts/cleanup, per process
+MONGO_READ_POOL_SIZE = int(os.getenv('MONGO_READ_POOL_SIZE', 20)) # Connections for dashboard reads, per process
+MONGO_MIN_POOL_SIZE = int(os.getenv('MONGO_MIN_POOL_SIZE', 10)) # Warm connections per pool, capped at that pool's size
+MONGO_READ_PREFERENCE = os.getenv('MONGO_READ_PREFERENCE', 'primaryPreferred') # Use 'secondary' on a replica set to offload polling
+MONGO_COMPRESSORS = os.getenv('MONGO_COMPRESSORS', 'zlib') # zlib is built in; zstd/snappy need their codec packages (see README)
 ACTIVITY_TIMEOUT_MINUTES = 5 # Students are considered offline if no activity is recorded within this time
+EVENT_TTL_SECONDS = int(os.getenv('EVENT_TTL_SECONDS', 86400)) # Events older than this are expired by MongoDB's TTL monitor
+EVENT_FLUSH_INTERVAL_SECONDS = 0.2 # Buffered attendance events are written to MongoDB at least this often
+EVENT_FLUSH_BATCH_SIZE = 500 # ...or as soon as this many events are waiting
+EVENT_BUFFER_MAX_SIZE = 10000 # Events held while MongoDB is unreachable; the oldest are dropped beyond this
+REPORT_CACHE_SECONDS = 2.0 # Dashboard polls within this window share one report (well under the activity timeout)
+QUERY_WORKERS = int(os.getenv('QUERY_WORKERS', 8)) # Concurrent MongoDB lookups per dashboard request
+LATEST_EVENT_INDEX = [('user_id', 1), ('server_timestamp', -1)] # Key order matches the latest-event sort exactly
+
+# --- JSON Serialization ---
+def orjson_default(obj):
+    """Serialize the BSON types orjson doesn't know about."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify() and request.get_json()."""
+
+    def dumps(self, obj, **kwargs):
+        # str for callers like the tojson template filter; responses use the bytes directly
+        return self.dumps_bytes(obj).decode()
+
+    def dumps_bytes(self, obj):
+        return orjson.dumps(obj, default=orjson_default, option=orjson.OPT_NAIVE_UTC)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping a decode/re-encode round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype='application/json')
+
+# --- Request Validation ---
+# Compiled once at import; validation is then a plain Python function call per request
+validate_event = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['user_id', 'event_type', 'metadata'],
+    'properties': {
+        'user_id': {'type': 'string'},
+        'event_type': {'type': 'string'},
+        'metadata': {'type': 'object'}
+    }
+})
 
 # --- App Setup ---
 app = Flask(__name__, template_folder='templates')
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # --- Database Initialization ---
-try:
-    # Use explicit port/host if MONGO_URI is default for better debugging clarity
-    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
-    client.admin.command('ismaster')
-    db = client[DB_NAME]
-    events_collection = db['events']
-    print(f"--- MongoDB Connection Successful: Connected to DB '{DB_NAME}' ---")
-except Exception as e:
-    print(f"--- MongoDB Connection Error: Failed to connect to server. Ensure MongoDB is running on {MONGO_URI} ---")
-    print(f"Error details: {e}")
-    client = None
-    db = None
+# connect=False: no sockets are opened at import (background threads start on the first
+# request, see start_background_workers), so the clients are safe to create before
+# gunicorn forks and a briefly unavailable MongoDB doesn't break startup. The driver's
+# server monitoring connects on first use; /healthz reports reachability on demand.
+# Writes and dashboard reads use separate clients so a slow report query can never hold
+# the connections heartbeat inserts are waiting on (and vice versa).
+client_options = dict(
+    compressors=MONGO_COMPRESSORS,
+    serverSelectionTimeoutMS=5000,
+    socketTimeoutMS=10000,
+    connect=False
+)
+write_client = MongoClient(
+    MONGO_URI,
+    maxPoolSize=MONGO_WRITE_POOL_SIZE,
+    minPoolSize=min(MONGO_MIN_POOL_SIZE, MONGO_WRITE_POOL_SIZE),
+    retryWrites=True,
+    w=1,
+    appname='attendance-writes',
+    **client_options
+)
+read_client = MongoClient(
+    MONGO_URI,
+    maxPoolSize=MONGO_READ_POOL_SIZE,
+    minPoolSize=min(MONGO_MIN_POOL_SIZE, MONGO_READ_POOL_SIZE),
+    readPreference=MONGO_READ_PREFERENCE,
+    appname='attendance-reads',
+    **client_options
+)
+events_collection = write_client[DB_NAME]['events']
+events_read_collection = read_client[DB_NAME]['events']
+
+def ensure_indexes():
+    """Create the events indexes if missing (a no-op when they already exist)."""
+    # Serves the "latest event per student" lookup without an in-memory sort
+    events_collection.create_index(LATEST_EVENT_INDEX)
+    # Bounds collection growth: mongod sweeps expired heartbeats in the background
+    try:
+        events_collection.create_index('server_timestamp', expireAfterSeconds=EVENT_TTL_SECONDS)
+    except OperationFailure as e:
+        if e.code != 85: # IndexOptionsConflict
+            raise
+        # The TTL index exists with a different expiry: change it in place
+        events_collection.database.command({
+            'collMod': events_collection.name,
+            'index': {'keyPattern': {'server_timestamp': 1}, 'expireAfterSeconds': EVENT_TTL_SECONDS}
+        })
+
+def init_database():
+    """Ensure indexes exist, retrying with backoff while MongoDB is unreachable."""
+    delay = 1
+    while True:
+        try:
+            ensure_indexes()
+            print(f"--- MongoDB Connection Successful: Indexes ready on DB '{DB_NAME}' ---")
+            return
+        except ConnectionFailure as e:
+            print(f"--- MongoDB Connection Error: Failed to connect to server. Ensure MongoDB is running on {MONGO_URI} ---")
+            print(f"Error details: {e} (retrying in {delay}s)")
+            time.sleep(delay)
+            delay = min(delay * 2, 60)
+        except Exception as e:
+            # Reachable but refusing (auth, conflicting index options, ...): retrying won't help
+            print(f"--- MongoDB Index Setup Failed on DB '{DB_NAME}': {e} ---")
+            return
+
+def start_index_setup():
+    """Run init_database off the request/import path."""
+    threading.Thread(target=init_database, name='init-database', daemon=True).start()
 
 # --- Mock User Data ---
 MOCK_USERS = {
@@ -35,6 +152,110 @@ MOCK_USERS = {
     "Soni": {"id": "MCA-112", "name": "Soni Priya", "role": "student", "password": "123"},
 }
 
+# Student ID -> name, derived once since MOCK_USERS never changes at runtime
+STUDENTS = {user_data['id']: user_data['name'] for user_data in MOCK_USERS.values() if user_data['role'] == 'student'}
+
+# client_status -> (dashboard status, whether tab focus is reported)
+STATUS_MAP = {
+    'logged_out': ('Logged Out', False),
+    'active': ('Active', True),
+    'idle': ('Idle', True),
+}
+
+# Dashboard timestamps are reported in IST
+IST = ZoneInfo('Asia/Kolkata')
+
+# --- Query Helpers ---
+# PyMongo is thread-safe, so the per-student lookups are overlapped on a shared pool
+# instead of paying one MongoDB round-trip after another.
+query_executor = ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix='mongo-query')
+
+def find_latest_event(user_id):
+    """Return the newest event for a user via the (user_id, server_timestamp) index, or None."""
+    query = {'user_id': user_id}
+    # Only the fields the report reads; skipping _id avoids the ObjectId round-trip
+    projection = {'_id': 0, 'event_type': 1, 'server_timestamp': 1, 'metadata.client_status': 1, 'metadata.tab_focused': 1}
+    try:
+        # Pin the compound index: the TTL index on server_timestamp alone also satisfies
+        # the sort, and the planner may otherwise pick it and scan every user's events
+        return events_read_collection.find_one(query, sort=LATEST_EVENT_INDEX, hint=LATEST_EVENT_INDEX, projection=projection)
+    except OperationFailure as e:
+        if e.code != 2: # BadValue: "hint provided does not correspond to an existing index"
+            raise
+        # The hinted index doesn't exist (yet): answer slower rather than not at all
+        return events_read_collection.find_one(query, sort=LATEST_EVENT_INDEX, projection=projection)
+
+# --- Event Buffer ---
+# Heartbeats are queued in-process and written with one insert_many per flush,
+# amortizing the MongoDB round-trip across every event in the batch.
+event_buffer = deque()
+buffer_lock = threading.Lock()
+# Held for a whole flush (take batch + insert) so clear_all_events can't drop the
+# collection while a batch it should discard is still on its way to MongoDB
+flush_lock = threading.Lock()
+flush_requested = threading.Event()
+
+def flush_events():
+    """Write all buffered events to MongoDB in a single unordered insert_many."""
+    global event_buffer
+    with flush_lock:
+        with buffer_lock:
+            if not event_buffer:
+                return
+            batch, event_buffer = event_buffer, deque()
+        try:
+            result = events_collection.insert_many(batch, ordered=False)
+            print(f"Flushed {len(result.inserted_ids)} attendance events.")
+        except ConnectionFailure as e:
+            # MongoDB unreachable: put the batch back in front (oldest first) for the next
+            # flush. insert_many already assigned each event an _id, so any that did land
+            # come back as duplicate-key errors rather than being stored twice.
+            with buffer_lock:
+                event_buffer.extendleft(reversed(batch))
+                dropped = max(len(event_buffer) - EVENT_BUFFER_MAX_SIZE, 0)
+                for _ in range(dropped):
+                    event_buffer.popleft()
+            print(f"Error flushing {len(batch)} attendance events, requeued ({dropped} oldest dropped): {e}")
+        except BulkWriteError as e:
+            failed = [error for error in e.details['writeErrors'] if error['code'] != 11000] # 11000: already stored
+            print(f"Dropped {len(failed)} of {len(batch)} attendance events: {e}")
+        except Exception as e:
+            print(f"Dropped {len(batch)} attendance events: {e}")
+
+def flush_loop():
+    """Background worker: flush on a timer, or early when the buffer fills up."""
+    while True:
+        flush_requested.wait(EVENT_FLUSH_INTERVAL_SECONDS)
+        flush_requested.clear()
+        flush_events()
+
+atexit.register(flush_events)
+
+# --- Background Workers ---
+# Started on the first request of each process rather than at import, so nothing
+# connects before gunicorn forks and every worker gets its own threads.
+background_pid = None
+background_lock = threading.Lock()
+
+@app.before_request
+def start_background_workers():
+    """Start this process's background threads once (cheap pid check afterwards)."""
+    global background_pid
+    if background_pid == os.getpid():
+        return
+    with background_lock:
+        if background_pid == os.getpid():
+            return
+        background_pid = os.getpid()
+        start_index_setup()
+        threading.Thread(target=flush_loop, name='event-flusher', daemon=True).start()
+
+# --- Report Cache ---
+# Every open teacher dashboard polls the report; a short-lived cache collapses
+# those polls into a single round of MongoDB lookups.
+report_cache = {'ts': float('-inf'), 'data': None}
+report_lock = threading.Lock()
+
 # --- Serve Homepage ---
 @app.route('/')
 def home():
@@ -44,12 +265,21 @@ def home():
 
 # --- API Routes ---
 
+@app.route('/healthz', methods=['GET'])
+def healthz():
+    """Report whether MongoDB is currently reachable."""
+    try:
+        write_client.admin.command('ping')
+        read_client.admin.command('ping')
+        return jsonify({"success": True, "message": "MongoDB reachable."}), 200
+    except Exception as e:
+        print(f"Health check failed: {e}")
+        return jsonify({"success": False, "message": "Database connection failed."}), 503
+
+
 @app.route('/api/authenticate', methods=['POST'])
 def authenticate():
     """Authenticate student or teacher and return role info."""
-    if not client:
-        return jsonify({"success": False, "message": "Database connection failed."}), 503
-            
     data = request.get_json()
     username = data.get('username')
     password = data.get('password')
@@ -73,17 +303,22 @@ def authenticate():
 @app.route('/api/track_attendance', methods=['POST'])
 def track_attendance():
     """Receive and store attendance events from students."""
-    if not client:
-        return jsonify({"success": False, "message": "Database connection failed."}), 503
     try:
         data = request.get_json()
-        if not all(k in data for k in ['user_id', 'event_type', 'metadata']):
-            return jsonify({"success": False, "message": "Missing required fields (user_id, event_type, metadata)."}), 400
+        try:
+            validate_event(data)
+        except fastjsonschema.JsonSchemaException as e:
+            return jsonify({"success": False, "message": f"Invalid event payload: {e.message}"}), 400
 
+        # Stamped on arrival, not at flush, so events sort correctly against a logout
+        # recorded by another worker process; also overwrites any client-sent value
         data['server_timestamp'] = datetime.utcnow()
-        result = events_collection.insert_one(data)
-        print(f"Attendance event recorded for {data['user_id']} ({data['event_type']}). ID: {result.inserted_id}")
-        return jsonify({"success": True, "message": "Event recorded."}), 200
+        with buffer_lock:
+            event_buffer.append(data)
+            buffered = len(event_buffer)
+        if buffered >= EVENT_FLUSH_BATCH_SIZE:
+            flush_requested.set()
+        return jsonify({"success": True, "message": "Event queued."}), 202
 
     except Exception as e:
         print(f"Error tracking attendance: {e}")
@@ -93,8 +328,6 @@ def track_attendance():
 @app.route('/api/logout_attendance', methods=['POST'])
 def logout_attendance():
     """Explicitly record a logout event."""
-    if not client:
-        return jsonify({"success": False, "message": "Database connection failed."}), 503
     try:
         data = request.get_json()
         user_id = data.get('user_id')
@@ -102,6 +335,7 @@ def logout_attendance():
         if not user_id:
             return jsonify({"success": False, "message": "Missing user_id for logout event."}), 400
 
+        now = datetime.utcnow()
         logout_event = {
             'user_id': user_id,
             'event_type': 'logout', # Use a distinct event type
@@ -110,9 +344,9 @@ def logout_attendance():
                 'client_status': 'logged_out', 
                 'tab_focused': False,
                 # Add a mock client timestamp for completeness
-                'client_timestamp': datetime.utcnow().isoformat() 
+                'client_timestamp': now.isoformat() 
             },
-            'server_timestamp': datetime.utcnow()
+            'server_timestamp': now
         }
         
         result = events_collection.insert_one(logout_event)
@@ -128,120 +362,116 @@ def logout_attendance():
 @app.route('/api/admin/clear_events', methods=['POST'])
 def clear_all_events():
     """Clears all documents from the events collection. FOR TESTING ONLY."""
-    if not client:
-        return jsonify({"success": False, "message": "Database connection failed."}), 503
     try:
         # Warning: This is a destructive operation!
-        result = events_collection.delete_many({})
-        print(f"!!! CLEARED {result.deleted_count} old attendance records for a fresh start. !!!")
-        return jsonify({"success": True, "message": f"Cleared {result.deleted_count} attendance records."}), 200
+        # Dropping is a metadata-only operation, unlike deleting every document one by one
+        deleted_count = events_collection.estimated_document_count()
+        with flush_lock:
+            with buffer_lock:
+                event_buffer.clear()
+            events_collection.drop()
+        try:
+            ensure_indexes()
+        except Exception as e:
+            print(f"Index setup after clearing events failed, retrying in background: {e}")
+            start_index_setup()
+        # Under the lock, so a rebuild already in progress can't re-cache pre-clear data afterwards
+        with report_lock:
+            report_cache['ts'] = float('-inf')
+        print(f"!!! CLEARED {deleted_count} old attendance records for a fresh start. !!!")
+        return jsonify({"success": True, "message": f"Cleared {deleted_count} attendance records."}), 200
     except Exception as e:
         print(f"Error clearing attendance records: {e}")
         return jsonify({"success": False, "message": "Internal server error during database cleanup."}), 500
 # --------------------------------------------------------
 
 
-@app.route('/api/admin/students', methods=['GET'])
-def get_student_data():
-    """Fetch latest attendance status for all students (teacher dashboard)."""
-    if not client:
-        return jsonify({"success": False, "message": "Database connection failed."}), 503
-    try:
-        # Get all student IDs and names
-        all_students = {user_data['id']: user_data['name'] for user_data in MOCK_USERS.values() if user_data['role'] == 'student'}
-        student_ids = list(all_students.keys())
-        
-        # 1. Aggregation pipeline to find the LATEST event for each student
-        pipeline = [
-            # Only consider events for known students
-            {'$match': {'user_id': {'$in': student_ids}}},
-            # Sort by timestamp, newest first
-            {'$sort': {'server_timestamp': -1}},
-            # Group by user_id, taking the first (newest) event
-            {'$group': {'_id': '$user_id', 'latest_event': {'$first': '$$ROOT'}}} 
-        ]
-        
-        latest_events_agg = list(events_collection.aggregate(pipeline))
+def build_status_report():
+    """Build the latest attendance status for every student from MongoDB."""
+    # 1. Fetch the LATEST event for each student via the (user_id, server_timestamp) index
+    # (dispatched concurrently; results come back in student order)
+    latest_events = query_executor.map(find_latest_event, STUDENTS)
+    latest_events_map = {user_id: event for user_id, event in zip(STUDENTS, latest_events) if event}
+    
+    status_report = []
+    
+    # Define the threshold for "fresh" activity
+    timeout_threshold = datetime.utcnow() - timedelta(minutes=ACTIVITY_TIMEOUT_MINUTES)
+    
+    # 2. Iterate over ALL students from MOCK_USERS to build the complete report
+    for user_id, name in STUDENTS.items():
+        event = latest_events_map.get(user_id)
         
-        # 2. Map latest events to a dictionary for quick lookup by ID
-        latest_events_map = {}
-        for event_group in latest_events_agg:
-            user_id = event_group['_id']
-            event = event_group['latest_event']
-            
-            # Convert ObjectId to string for JSON serialization
-            if '_id' in event and isinstance(event['_id'], ObjectId):
-                event['_id'] = str(event['_id']) 
-            
-            latest_events_map[user_id] = event
+        # Default status for students with no events
+        if not event:
+            status_report.append({
+                "id": user_id,
+                "name": name,
+                "status": "Never Logged In",
+                "focus": "N/A",
+                "last_event": "None",
+                "timestamp": "N/A"
+            })
+            continue
         
-        status_report = []
+        # Process event data
+        client_status = event['metadata'].get('client_status', 'N/A').lower()
+        tab_focused = event['metadata'].get('tab_focused', False)
         
-        # Define the threshold for "fresh" activity
-        timeout_threshold = datetime.utcnow() - timedelta(minutes=ACTIVITY_TIMEOUT_MINUTES)
+        # --- Status determination logic with Staleness Check ---
+        status_entry = STATUS_MAP.get(client_status)
+        # Check for timeout ONLY if the student is not explicitly logged out
+        if client_status != 'logged_out' and event['server_timestamp'] < timeout_threshold:
+            # This student's last recorded active/idle event is stale
+            status = 'Offline (Inactive)'
+            focus = 'N/A'
+        elif status_entry is None:
+            # Handles any unexpected status types found in the database
+            status = f'Unknown ({client_status.title()})'
+            focus = 'N/A'
+        else:
+            status, reports_focus = status_entry
+            focus = ('Focused' if tab_focused else 'Blurred') if reports_focus else 'N/A'
+        # --------------------------------------------------------
         
-        # *** MODIFICATION START: Define IST Offset ***
-        IST_OFFSET = timedelta(hours=5, minutes=30)
+        # *** MODIFICATION START: Convert UTC to IST ***
+        utc_timestamp = event['server_timestamp']
+        ist_timestamp = utc_timestamp.replace(tzinfo=timezone.utc).astimezone(IST)
         # *** MODIFICATION END ***
         
-        # 3. Iterate over ALL students from MOCK_USERS to build the complete report
-        for user_id, name in all_students.items():
-            event = latest_events_map.get(user_id)
-            
-            # Default status for students with no events
-            if not event:
-                status_report.append({
-                    "id": user_id,
-                    "name": name,
-                    "status": "Never Logged In",
-                    "focus": "N/A",
-                    "last_event": "None",
-                    "timestamp": "N/A"
-                })
-                continue
-            
-            # Process event data
-            client_status = event['metadata'].get('client_status', 'N/A').lower()
-            tab_focused = event['metadata'].get('tab_focused', False)
-            
-            # --- Status determination logic with Staleness Check ---
-            if client_status == 'logged_out':
-                status = 'Logged Out'
-                focus = 'N/A'
-            # Check for timeout ONLY if the student is not explicitly logged out
-            elif event['server_timestamp'] < timeout_threshold:
-                # This student's last recorded active/idle event is stale
-                status = f'Offline (Inactive)'
-                focus = 'N/A'
-            elif client_status == 'active':
-                status = 'Active'
-                focus = 'Focused' if tab_focused else 'Blurred'
-            elif client_status == 'idle':
-                status = 'Idle'
-                focus = 'Focused' if tab_focused else 'Blurred'
-            else:
-                # Handles any unexpected status types found in the database
-                status = f'Unknown ({client_status.title()})'
-                focus = 'N/A'
-            # --------------------------------------------------------
-            
-            # *** MODIFICATION START: Convert UTC to IST ***
-            utc_timestamp = event['server_timestamp']
-            ist_timestamp = utc_timestamp + IST_OFFSET 
+        status_report.append({
+            "id": user_id,
+            "name": name,
+            "status": status,
+            "focus": focus,
+            "last_event": event['event_type'],
+            # *** MODIFICATION START: Use IST Timestamp ***
+            "timestamp": ist_timestamp.isoformat(timespec='seconds')
             # *** MODIFICATION END ***
-            
-            status_report.append({
-                "id": user_id,
-                "name": name,
-                "status": status,
-                "focus": focus,
-                "last_event": event['event_type'],
-                # *** MODIFICATION START: Use IST Timestamp ***
-                "timestamp": ist_timestamp.isoformat()
-                # *** MODIFICATION END ***
-            })
-            
-        print(f"Admin report generated for {len(status_report)} students.")
+        })
+        
+    print(f"Admin report generated for {len(status_report)} students.")
+    return status_report
+
+def cached_status_report():
+    """Return the status report, rebuilding it at most once per REPORT_CACHE_SECONDS."""
+    if time.monotonic() - report_cache['ts'] < REPORT_CACHE_SECONDS:
+        return report_cache['data']
+    with report_lock:
+        # Concurrent polls queue here; re-check so only the first one hits MongoDB
+        if time.monotonic() - report_cache['ts'] < REPORT_CACHE_SECONDS:
+            return report_cache['data']
+        status_report = build_status_report()
+        report_cache['data'] = status_report
+        report_cache['ts'] = time.monotonic()
+        return status_report
+
+
+@app.route('/api/admin/students', methods=['GET'])
+def get_student_data():
+    """Fetch latest attendance status for all students (teacher dashboard)."""
+    try:
+        status_report = cached_status_report()
         return jsonify({"success": True, "data": status_report})
     
     except Exception as e:
@@ -250,4 +480,5 @@ def get_student_data():
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='127.0.0.1', port=5000, use_reloader=False)
\ No newline at end of file
+    # Development only; see README.md for running under gunicorn
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', host='127.0.0.1', port=5000, use_reloader=False)
\ No newline at end of file